@@ -35,149 +35,424 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import bisect
+import contextlib
+import functools
+import hashlib
 import http.server
 import json
 import os
-import socketserver
+import re
 import sys
-import textwrap
+import urllib.parse
 import webbrowser
+import xml.sax.saxutils
+from dataclasses import dataclass
 from pathlib import Path
 
 import edge_tts
-from jinja2 import Template
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    select_autoescape,
+)
 from tqdm import tqdm
 
 # ---------------------------------------------------------------------------
-# HTML template with keyboard listeners
+# Templates (templates/player.html, templates/selection.html)
 # ---------------------------------------------------------------------------
-HTML_TEMPLATE = Template(
-    textwrap.dedent(
-        """
-        <!DOCTYPE html>
-        <html lang=\"en\">
-        <head>
-          <meta charset=\"utf-8\" />
-          <title>Questionnaire Player</title>
-          <style>
-             :root { color-scheme: light dark; }
-             body { font-family: system-ui, sans-serif; display:flex; flex-direction:column; align-items:center; justify-content:center; height:100vh; margin:0; }
-             #controls { display:flex; gap:2rem; margin-top:2rem; }
-             button { font-size:2rem; padding:0.5rem 1rem; border:none; background:#222; color:#fff; border-radius:0.5rem; cursor:pointer; }
-             button:disabled { opacity:0.4; cursor:auto; }
-             #current { font-size:1.5rem; margin:1rem auto; max-width:80%; text-align:center; line-height:1.4; }
-             #item-number { font-size:1rem; color:#888; margin-bottom:1rem; }
-          </style>
-        </head>
-        <body>
-          <h1>PAI Items</h1>
-          <div id=\"item-number\"></div>
-          <div id=\"current\"></div>
-          <div id=\"controls\">
-            <button id=\"prev\">⬅️</button>
-            <button id=\"replay\">🔁</button>
-            <button id=\"next\">➡️</button>
-          </div>
-          <script>
-            const items = {{ items_json | safe }};
-            let idx = 0;
-            let isPlaying = false;
-            const audio = new Audio();
-            const currentDiv = document.getElementById('current');
-            const itemNumberDiv = document.getElementById('item-number');
-            const prevBtn = document.getElementById('prev');
-            const nextBtn = document.getElementById('next');
-            const replayBtn = document.getElementById('replay');
-
-            function updateButtons(){
-                prevBtn.disabled = idx === 0 || isPlaying;
-                nextBtn.disabled = idx === items.length-1 || isPlaying;
-            }
-            function playItem(){
-                itemNumberDiv.textContent = `Item ${idx + 1} of ${items.length}`;
-                currentDiv.textContent = items[idx].text;
-                audio.src = items[idx].audio;
-                updateButtons();
-                audio.play();
-            }
-            prevBtn.addEventListener('click', ()=>{ if(idx>0 && !isPlaying){ idx--; playItem(); }});
-            nextBtn.addEventListener('click', ()=>{ if(idx<items.length-1 && !isPlaying){ idx++; playItem(); }});
-            replayBtn.addEventListener('click', ()=>{ if(!isPlaying){ audio.currentTime = 0; audio.play(); }});
-
-            // audio event listeners
-            audio.addEventListener('play', () => {
-                isPlaying = true;
-                updateButtons();
-            });
-            audio.addEventListener('ended', () => {
-                isPlaying = false;
-                updateButtons();
-            });
-            audio.addEventListener('pause', () => {
-                isPlaying = false;
-                updateButtons();
-            });
-            audio.addEventListener('error', () => {
-                isPlaying = false;
-                updateButtons();
-                console.error('Audio failed to load');
-            });
-
-            // keyboard shortcuts
-            document.addEventListener('keydown', e => {
-              switch(e.key){
-                case 'ArrowLeft':
-                  e.preventDefault(); if(!isPlaying) prevBtn.click(); break;
-                case 'ArrowRight':
-                  e.preventDefault(); if(!isPlaying) nextBtn.click(); break;
-                case ' ': // space bar
-                case 'r':
-                case 'R':
-                  e.preventDefault(); if(!isPlaying) replayBtn.click(); break;
-              }
-            });
-
-            window.onload = playItem;
-          </script>
-        </body>
-        </html>
-        """
-    )
+TEMPLATES_DIR = Path(__file__).resolve().parent / "templates"
+TEMPLATE_ENV = Environment(
+    loader=FileSystemLoader(TEMPLATES_DIR),
+    autoescape=select_autoescape(["html"]),
+    auto_reload=False,
+    bytecode_cache=FileSystemBytecodeCache(),
 )
 
 # ---------------------------------------------------------------------------
 # TTS helpers
 # ---------------------------------------------------------------------------
+# edge-tts always requests audio-24khz-48kbitrate-mono-mp3: constant 144-byte
+# frames of 24 ms each. WordBoundary offsets are in 100 ns ticks.
+_EDGE_FRAME_BYTES = 144
+_EDGE_FRAME_TICKS = 240_000
+_EDGE_BYTES_PER_SECOND = 48_000 // 8
+# Upper bound for one batched request, in UTF-8 bytes after XML escaping. edge-tts
+# splits anything over ~64 KiB into several turns and only estimates the padding
+# between them, which would break the tick-to-byte cut math below.
+MAX_BATCH_BYTES = 16 * 1024
+# Write buffer for streamed audio: most items (~10 s at 48 kbit/s) fit in one write.
+_AUDIO_WRITE_BUFFER = 64 * 1024
+
+@contextlib.contextmanager
+def _atomic_open(outfile: Path, buffering: int = -1):
+    """Open a ``.part`` sibling of *outfile* for writing; move it into place on success.
+
+    If the block raises (or the run is interrupted), *outfile* is left untouched.
+    """
+    partfile = outfile.with_name(outfile.name + ".part")
+    try:
+        with open(partfile, "wb", buffering=buffering) as f:
+            yield f
+        os.replace(partfile, outfile)
+    finally:
+        partfile.unlink(missing_ok=True)
+
 async def synthesize(text: str, outfile: Path, voice: str) -> None:
-    """Render *text* to *outfile* with Edge Neural voice."""
+    """Render *text* to *outfile* with Edge Neural voice.
+
+    Audio chunks are streamed through a 64 KiB write buffer into a ``.part`` file
+    that only replaces *outfile* once the stream finishes, so an interrupted run
+    never leaves a truncated MP3 behind for the cache check to pick up.
+    """
     communicate = edge_tts.Communicate(text, voice=voice)
-    await communicate.save(str(outfile))
+    with _atomic_open(outfile, buffering=_AUDIO_WRITE_BUFFER) as f:
+        async for chunk in communicate.stream():
+            if chunk["type"] == "audio":
+                f.write(chunk["data"])
+
+def request_bytes(text: str) -> int:
+    """Size of *text* as edge-tts sends it: XML-escaped, UTF-8 encoded."""
+    return len(xml.sax.saxutils.escape(text).encode("utf-8"))
+
+async def synthesize_batch(texts: list[str], outfiles: list[Path], voice: str) -> bool:
+    """Render several *texts* in one request and split the audio into *outfiles*.
+
+    The texts are spoken as one newline-separated document. Word-boundary events
+    are matched back to the text they came from, and the MP3 is cut on the frame
+    nearest the middle of the pause between consecutive items. Returns ``False``
+    without writing anything if some item can't be located in the audio, so the
+    caller can fall back to :func:`synthesize`.
+    """
+    joined = "\n".join(texts)
+    if request_bytes(joined) > MAX_BATCH_BYTES:
+        return False
+    starts = []
+    pos = 0
+    for text in texts:
+        starts.append(pos)
+        pos += len(text) + 1
+
+    communicate = edge_tts.Communicate(joined, voice=voice)
+    audio = bytearray()
+    words: list[tuple[int, int, str]] = []
+    async for chunk in communicate.stream():
+        if chunk["type"] == "audio":
+            audio += chunk["data"]
+        elif chunk["type"] == "WordBoundary":
+            words.append((chunk["offset"], chunk["offset"] + chunk["duration"], chunk["text"]))
+
+    # (first word start, last word end) per item, in ticks
+    spans: list[tuple[int, int] | None] = [None] * len(texts)
+    cursor = 0
+    for start, end, word in words:
+        pos = joined.find(word, cursor)
+        if pos < 0:
+            return False
+        cursor = pos + len(word)
+        item = bisect.bisect_right(starts, pos) - 1
+        first = spans[item][0] if spans[item] else start
+        spans[item] = (first, end)
+    if None in spans:
+        return False
+
+    cuts = [0]
+    for (_, prev_end), (next_start, _) in zip(spans, spans[1:]):
+        mid = (prev_end + next_start) // 2
+        frame = (mid + _EDGE_FRAME_TICKS // 2) // _EDGE_FRAME_TICKS
+        cuts.append(frame * _EDGE_FRAME_BYTES)
+    cuts.append(len(audio))
+    # Every cut has to land on a frame sync word, or the frame-size assumption broke.
+    if any(b <= a for a, b in zip(cuts, cuts[1:])) or any(audio[c] != 0xFF for c in cuts[:-1]):
+        return False
+    for outfile, a, b in zip(outfiles, cuts, cuts[1:]):
+        with _atomic_open(outfile) as f:
+            f.write(audio[a:b])
+    return True
+
+class EdgeTtsPool:
+    """Fixed set of synthesis slots shared by every request for one voice.
+
+    edge-tts opens a websocket per ``Communicate`` and closes it with the stream,
+    so sockets can't be held open between items. What the pool does keep warm is
+    everything around them: a single probe request resolves DNS and lets edge-tts
+    settle its DRM clock-skew correction before the batch fans out, instead of
+    every concurrent request paying for (or retrying on) it.
+    """
+
+    def __init__(self, voice: str, pool_size: int = 4, warmup: bool = True) -> None:
+        if pool_size < 1:
+            raise ValueError(f"pool_size must be at least 1, got {pool_size}")
+        self.voice = voice
+        self.pool_size = pool_size
+        self.warmup_enabled = warmup
+        self._slots: asyncio.Queue[int] = asyncio.Queue(maxsize=pool_size)
+        for slot in range(pool_size):
+            self._slots.put_nowait(slot)
+        self._warmup_task: asyncio.Task[None] | None = None
+
+    async def warmup(self) -> None:
+        """Synthesize a tiny probe string once; concurrent callers share the probe."""
+        if not self.warmup_enabled:
+            return
+        if self._warmup_task is None:
+            self._warmup_task = asyncio.ensure_future(self._probe())
+        await self._warmup_task
+
+    async def _probe(self) -> None:
+        probe = edge_tts.Communicate("Ready.", voice=self.voice)
+        async for _ in probe.stream():
+            pass
 
-async def build_audio(items: list[str], voice: str, outdir: Path, force: bool) -> None:
+    async def synthesize(self, text: str, outfile: Path) -> None:
+        slot = await self._slots.get()
+        try:
+            await synthesize(text, outfile, self.voice)
+        finally:
+            self._slots.put_nowait(slot)
+
+    async def synthesize_batch(self, texts: list[str], outfiles: list[Path]) -> None:
+        """Synthesize *texts* in one request, falling back to one request per text."""
+        slot = await self._slots.get()
+        try:
+            if len(texts) > 1 and await synthesize_batch(texts, outfiles, self.voice):
+                return
+            for text, outfile in zip(texts, outfiles):
+                await synthesize(text, outfile, self.voice)
+        finally:
+            self._slots.put_nowait(slot)
+
+    async def aclose(self) -> None:
+        """Cancel a warmup probe that is still in flight."""
+        if self._warmup_task is not None and not self._warmup_task.done():
+            self._warmup_task.cancel()
+            try:
+                await self._warmup_task
+            except asyncio.CancelledError:
+                pass
+
+@dataclass
+class TTSContext:
+    """Synthesis resources and settings shared by one CLI run.
+
+    Created once in :func:`main` and closed there, so every build in the run
+    reuses the same pool on the same event loop.
+    """
+
+    pool: EdgeTtsPool
+    force: bool = False
+    batch_bytes: int = 0  # pack consecutive short items into one request; 0 = off
+
+    async def aclose(self) -> None:
+        await self.pool.aclose()
+
+def _scan_audio_dir(outdir: Path, force: bool) -> dict[str, int]:
+    """Create *outdir* and map its file names to sizes in one directory read.
+
+    Returns an empty mapping if *force*, so every item counts as missing.
+    """
     outdir.mkdir(parents=True, exist_ok=True)
-    for idx, line in enumerate(tqdm(items, desc="Synthesizing")):
-        mp3_path = outdir / f"{idx:04d}.mp3"
-        if force or not mp3_path.exists():
-            await synthesize(line, mp3_path, voice)
+    if force:
+        return {}
+    with os.scandir(outdir) as entries:
+        return {entry.name: entry.stat().st_size for entry in entries if entry.is_file()}
+
+async def build_audio(
+    items: list[str], outdir: Path, ctx: TTSContext, desc: str = "Synthesizing"
+) -> list[Path]:
+    """Synthesize missing items through ``ctx.pool``, which bounds requests in flight.
+
+    Returns the written MP3 paths in completion order; filenames encode the index.
+    """
+    existing = await to_thread(_scan_audio_dir, outdir, ctx.force)
+    pending = [
+        (idx, line)
+        for idx, line in enumerate(items)
+        if f"{idx:04d}.mp3" not in existing
+    ]
+    if not pending:
+        return []
+    await ctx.pool.warmup()
+
+    # Group consecutive pending items up to ctx.batch_bytes per request.
+    groups: list[list[tuple[int, str]]] = []
+    group_bytes = 0
+    for idx, line in pending:
+        size = request_bytes(line)
+        if groups and group_bytes + 1 + size <= ctx.batch_bytes:  # +1 for the "\n" separator
+            groups[-1].append((idx, line))
+            group_bytes += 1 + size
+        else:
+            groups.append([(idx, line)])
+            group_bytes = size
+
+    async def _one(group: list[tuple[int, str]]) -> list[Path]:
+        mp3_paths = [outdir / f"{idx:04d}.mp3" for idx, _ in group]
+        if len(group) == 1:
+            await ctx.pool.synthesize(group[0][1], mp3_paths[0])
+        else:
+            await ctx.pool.synthesize_batch([line for _, line in group], mp3_paths)
+        return mp3_paths
+
+    tasks = [asyncio.create_task(_one(group)) for group in groups]
+    done: list[Path] = []
+    with tqdm(total=len(pending), desc=desc) as pbar:
+        for fut in asyncio.as_completed(tasks):
+            mp3_paths = await fut
+            done.extend(mp3_paths)
+            pbar.update(len(mp3_paths))
+    return done
+
+# ---------------------------------------------------------------------------
+# MP3 helpers
+# ---------------------------------------------------------------------------
+# Layer III bitrates in kbit/s, indexed by the header's 4-bit bitrate field.
+_MP3_BITRATES = {
+    "mpeg1": (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    "mpeg2": (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+DEFAULT_ITEM_SECONDS = 15
+
+def mp3_duration(path: Path) -> float | None:
+    """Estimate the length of a constant-bitrate MP3 from its first frame header.
+
+    Skips a leading ID3v2 tag, reads the bitrate from the first Layer III frame and
+    divides the remaining file size by it. Returns ``None`` if the file is missing
+    or doesn't start with a frame we understand.
+    """
+    try:
+        size = path.stat().st_size
+        with open(path, "rb") as f:
+            head = f.read(10)
+            offset = 0
+            if head[:3] == b"ID3" and len(head) == 10:
+                tag_size = (head[6] << 21) | (head[7] << 14) | (head[8] << 7) | head[9]
+                offset = 10 + tag_size + (10 if head[5] & 0x10 else 0)
+                f.seek(offset)
+                head = f.read(4)
+    except OSError:
+        return None
+    if len(head) < 4 or head[0] != 0xFF or head[1] & 0xE0 != 0xE0:
+        return None
+    version = (head[1] >> 3) & 0b11  # 3 = MPEG-1, 2 = MPEG-2, 0 = MPEG-2.5
+    layer = (head[1] >> 1) & 0b11  # 1 = Layer III
+    bitrate_index = head[2] >> 4
+    if layer != 1 or version == 1 or not 0 < bitrate_index < 15:
+        return None
+    kbps = _MP3_BITRATES["mpeg1" if version == 3 else "mpeg2"][bitrate_index]
+    return (size - offset) * 8 / (kbps * 1000)
+
+def audio_durations(audio_dir: Path, count: int) -> list[float | None]:
+    """Per-item durations from a single scan of *audio_dir*.
+
+    Files made of whole edge-tts frames are timed from their size alone; anything
+    else (tagged or foreign MP3s) falls back to :func:`mp3_duration`.
+    """
+    sizes = _scan_audio_dir(audio_dir, force=False)
+    durations: list[float | None] = []
+    for idx in range(count):
+        name = f"{idx:04d}.mp3"
+        size = sizes.get(name)
+        if size is None:
+            durations.append(None)
+        elif size and size % _EDGE_FRAME_BYTES == 0:
+            durations.append(size / _EDGE_BYTES_PER_SECOND)
+        else:
+            durations.append(mp3_duration(audio_dir / name))
+    return durations
+
+def format_duration(durations: list[float | None]) -> str:
+    """Total *durations* as ``m:ss``, counting unknown items as a flat estimate."""
+    seconds = round(sum(DEFAULT_ITEM_SECONDS if d is None else d for d in durations))
+    return f"{seconds // 60}:{seconds % 60:02d}"
+
+async def to_thread(func, *args, **kwargs):
+    """Run blocking *func* on the default executor (``asyncio.to_thread`` is 3.9+)."""
+    call = functools.partial(func, *args, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(None, call)
 
 # ---------------------------------------------------------------------------
 # HTML + server helpers
 # ---------------------------------------------------------------------------
-def make_index(items: list[str], outdir: Path) -> None:
+@functools.lru_cache(maxsize=None)
+def _template_source(name: str) -> bytes:
+    source, _, _ = TEMPLATE_ENV.loader.get_source(TEMPLATE_ENV, name)
+    return source.encode("utf-8")
+
+def render_cached(template_name: str, outfile: Path, key: str, **context) -> bool:
+    """Render *template_name* into *outfile* unless *key* matches the previous build.
+
+    The digest of *key* and the template source is kept in an ``<outfile>.hash``
+    sidecar. Returns ``True`` if the page was (re)written.
+    """
+    digest = hashlib.blake2b(key.encode("utf-8"))
+    digest.update(_template_source(template_name))
+    h = digest.hexdigest()
+    sidecar = outfile.with_name(outfile.name + ".hash")
+    try:
+        if outfile.exists() and sidecar.read_text(encoding="utf-8") == h:
+            return False
+    except FileNotFoundError:
+        pass
+    html = TEMPLATE_ENV.get_template(template_name).render(**context)
+    outfile.write_text(html, encoding="utf-8")
+    sidecar.write_text(h, encoding="utf-8")
+    return True
+
+def make_index(items: list[str], outdir: Path, durations: list[float | None]) -> None:
     mapping = [
-        {"text": line, "audio": f"audio/{idx:04d}.mp3"}
-        for idx, line in enumerate(items)
+        {
+            "text": line,
+            "audio": f"audio/{idx:04d}.mp3",
+            "duration": None if duration is None else round(duration, 2),
+        }
+        for idx, (line, duration) in enumerate(zip(items, durations))
     ]
-    html = HTML_TEMPLATE.render(items_json=json.dumps(mapping, ensure_ascii=False))
-    (outdir / "index.html").write_text(html, encoding="utf-8")
+    items_json = json.dumps(mapping, ensure_ascii=False, separators=(",", ":"))
+    render_cached("player.html", outdir / "index.html", items_json, items_json=items_json)
 
 class SilentRequestHandler(http.server.SimpleHTTPRequestHandler):
+    _etag: str | None = None
+
     def log_message(self, *args):
         pass  # shhh
 
+    def _is_audio(self) -> bool:
+        path = urllib.parse.urlsplit(self.path).path
+        return "/audio/" in path and path.endswith(".mp3")
+
+    def send_head(self):
+        # MP3s keep their name across --force rebuilds, so they are revalidated
+        # against an mtime/size ETag rather than marked immutable; an unchanged
+        # file costs a 304 with no body.
+        self._etag = None
+        if self._is_audio():
+            try:
+                st = os.stat(self.translate_path(self.path))
+            except OSError:
+                return super().send_head()
+            self._etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+            if self._etag in self.headers.get("If-None-Match", ""):
+                self.send_response(http.HTTPStatus.NOT_MODIFIED)
+                self.end_headers()
+                return None
+        return super().send_head()
+
+    def end_headers(self):
+        if self._etag is not None:
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("ETag", self._etag)
+        super().end_headers()
+
+    def copyfile(self, source, outputfile):
+        # socket.sendfile() uses os.sendfile() for real files and falls back to
+        # plain send() for in-memory bodies such as directory listings.
+        self.connection.sendfile(source)
+
 def serve(directory: Path, port: int = 8000) -> None:
     os.chdir(directory)
-    with socketserver.TCPServer(("", port), SilentRequestHandler) as httpd:
+    with http.server.ThreadingHTTPServer(("", port), SilentRequestHandler) as httpd:
         url = f"http://localhost:{port}/selection.html"
         print(f"Serving on {url} (Ctrl+C to stop)…")
         webbrowser.open(url)
@@ -186,52 +461,66 @@ def serve(directory: Path, port: int = 8000) -> None:
         except KeyboardInterrupt:
             print("\nServer stopped.")
 
-async def build_all_questionnaires(project_dir: Path, voice: str, force: bool) -> None:
-    """Build all questionnaires in the questionnaires/ directory."""
+_WORD_RE = re.compile(r"\S+")
+
+def read_items(path: Path) -> tuple[list[str], int]:
+    """Return the stripped, non-blank lines of *path* and their total word count."""
+    text = path.read_text(encoding="utf-8")
+    items = [line for line in map(str.strip, text.splitlines()) if line]
+    return items, sum(1 for _ in _WORD_RE.finditer(text))
+
+async def build_all_questionnaires(project_dir: Path, ctx: TTSContext) -> None:
+    """Build all questionnaires in the questionnaires/ directory.
+
+    Questionnaires are built concurrently; ``ctx.pool`` is shared between them so the
+    total number of TTS requests in flight stays bounded.
+    """
     questionnaires_dir = Path.cwd() / "questionnaires"
     if not questionnaires_dir.exists():
         sys.exit("❌ questionnaires/ directory not found")
     
-    project_dir.mkdir(exist_ok=True)
-    questionnaire_cards = []
+    # Filesystem calls go through to_thread so they don't stall in-flight synthesis.
+    await to_thread(project_dir.mkdir, exist_ok=True)
     
     # Find all .txt files in questionnaires/
-    questionnaire_files = list(questionnaires_dir.glob("*.txt"))
+    questionnaire_files = await to_thread(lambda: list(questionnaires_dir.glob("*.txt")))
     if not questionnaire_files:
         sys.exit("❌ No questionnaire files found in questionnaires/ directory")
     
-    for questionnaire_file in tqdm(questionnaire_files, desc="Building questionnaires"):
+    async def process_one(questionnaire_file: Path) -> dict:
         questionnaire_name = questionnaire_file.stem
         questionnaire_dir = project_dir / questionnaire_name
         audio_dir = questionnaire_dir / "audio"
         
         # Read items
-        items = [line.strip() for line in questionnaire_file.read_text(encoding="utf-8").splitlines() if line.strip()]
+        items, total_words = await to_thread(read_items, questionnaire_file)
         
         # Build audio
-        await build_audio(items, voice, audio_dir, force)
+        await build_audio(items, audio_dir, ctx, desc=questionnaire_name)
         
         # Create index.html for this questionnaire
-        make_index(items, questionnaire_dir)
+        durations = await to_thread(audio_durations, audio_dir, len(items))
+        await to_thread(make_index, items, questionnaire_dir, durations)
         
-        # Create card for selection page
-        card_html = f'''
-        <div class="questionnaire-card" data-link="{questionnaire_name}/index.html">
-          <div class="questionnaire-title">{questionnaire_name.replace('_', ' ').title()}</div>
-          <div class="questionnaire-description">
-            {len(items)} questions • {sum(len(item.split()) for item in items)} words
-          </div>
-          <div class="questionnaire-stats">
-            Estimated duration: {len(items) * 15 // 60}:{len(items) * 15 % 60:02d}
-          </div>
-        </div>
-        '''
-        questionnaire_cards.append(card_html)
+        # Card for selection page
+        return {
+            "link": f"{questionnaire_name}/index.html",
+            "title": questionnaire_name.replace("_", " ").title(),
+            "count": len(items),
+            "words": total_words,
+            "duration": format_duration(durations),
+        }
+    
+    questionnaire_cards = await asyncio.gather(*(process_one(qf) for qf in questionnaire_files))
     
     # Create selection page
-    selection_template = Path("selection_template.html").read_text(encoding="utf-8")
-    selection_html = selection_template.replace("{{ questionnaire_cards | safe }}", "\n".join(questionnaire_cards))
-    (project_dir / "selection.html").write_text(selection_html, encoding="utf-8")
+    await to_thread(
+        render_cached,
+        "selection.html",
+        project_dir / "selection.html",
+        json.dumps(questionnaire_cards),
+        questionnaires=questionnaire_cards,
+    )
     
     print(f"✅ Built {len(questionnaire_files)} questionnaires")
     print(f"📁 Site ready at {project_dir}")
@@ -239,6 +528,18 @@ async def build_all_questionnaires(project_dir: Path, voice: str, force: bool) -
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
+def batch_size(value: str) -> int:
+    number = int(value)
+    if not 0 <= number <= MAX_BATCH_BYTES:
+        raise argparse.ArgumentTypeError(f"must be between 0 and {MAX_BATCH_BYTES}, got {number}")
+    return number
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
 async def main(argv: list[str] | None = None) -> None:
     parser = argparse.ArgumentParser(description="Build & serve a questionnaire TTS web page")
     parser.add_argument("items_file", nargs="?", help="Text file with one item per line")
@@ -246,29 +547,40 @@ async def main(argv: list[str] | None = None) -> None:
     parser.add_argument("--serve-only", action="store_true", help="Skip audio generation & just serve")
     parser.add_argument("--force", action="store_true", help="Regenerate audio even if it already exists")
     parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--num-parallel-requests", type=positive_int, default=4, help="Max concurrent TTS requests")
+    parser.add_argument("--batch-bytes", type=batch_size, default=0, help=f"Pack consecutive short items into one TTS request of up to this many bytes (0 = off, max {MAX_BATCH_BYTES})")
     parser.add_argument("--build-all", action="store_true", help="Build all questionnaires in questionnaires/ directory")
     args = parser.parse_args(argv)
 
     project_dir = Path.cwd() / "tts_site"
+    ctx = TTSContext(
+        EdgeTtsPool(args.voice, args.num_parallel_requests),
+        force=args.force,
+        batch_bytes=args.batch_bytes,
+    )
     
-    if args.build_all:
-        await build_all_questionnaires(project_dir, args.voice, args.force)
-    elif not args.serve_only:
-        if args.items_file:
-            try:
-                items = [line.strip() for line in Path(args.items_file).read_text(encoding="utf-8").splitlines() if line.strip()]
-            except FileNotFoundError:
-                sys.exit(f"❌ items_file '{args.items_file}' not found")
-        else:
-            items = [
-                "Please state your full name.",
-                "On a scale from one to ten, how would you rate your current mood?",
-                "Have you experienced any headaches in the past week?",
-            ]
-        audio_dir = project_dir / "audio"
-        project_dir.mkdir(exist_ok=True)
-        await build_audio(items, args.voice, audio_dir, args.force)
-        make_index(items, project_dir)
+    try:
+        if args.build_all:
+            await build_all_questionnaires(project_dir, ctx)
+        elif not args.serve_only:
+            if args.items_file:
+                try:
+                    items, _ = read_items(Path(args.items_file))
+                except FileNotFoundError:
+                    sys.exit(f"❌ items_file '{args.items_file}' not found")
+            else:
+                items = [
+                    "Please state your full name.",
+                    "On a scale from one to ten, how would you rate your current mood?",
+                    "Have you experienced any headaches in the past week?",
+                ]
+            audio_dir = project_dir / "audio"
+            project_dir.mkdir(exist_ok=True)
+            await build_audio(items, audio_dir, ctx)
+            durations = await to_thread(audio_durations, audio_dir, len(items))
+            make_index(items, project_dir, durations)
+    finally:
+        await ctx.aclose()
 
     if not (project_dir / "index.html").exists():
         sys.exit("❌ No site built yet; run without --serve-only first.")
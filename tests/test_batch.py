@@ -0,0 +1,103 @@
+import asyncio
+
+import pai_tts
+
+FRAME = bytes([0xFF, 0xF3, 0x64, 0xC4]) + bytes(140)  # MPEG-2 Layer III, 48 kbit/s, 24 kHz
+M = 1_000_000  # ticks
+
+
+def stub_communicate(monkeypatch, script):
+    """Replace edge_tts.Communicate; *script(text)* returns (words, audio) for a request."""
+    texts = []
+
+    class StubCommunicate:
+        def __init__(self, text, voice=None, **kwargs):
+            self.text = text
+            texts.append(text)
+
+        async def stream(self):
+            words, audio = script(self.text)
+            for offset, duration, word in words:
+                yield {"type": "WordBoundary", "offset": offset, "duration": duration, "text": word}
+            yield {"type": "audio", "data": audio}
+
+    monkeypatch.setattr(pai_tts.edge_tts, "Communicate", StubCommunicate)
+    return texts
+
+
+def three_items(text):
+    words = [
+        (2 * M, 3 * M, "Hello"), (5_500_000, 3 * M, "there"),      # item 0 ends at 8.5M
+        (14 * M, 3 * M, "Second"), (21 * M, 3 * M, "item"),        # item 1: 14M .. 24M
+        (29_500_000, 3 * M, "Third"), (33 * M, 3 * M, "one"),      # item 2 starts at 29.5M
+    ]
+    return words, FRAME * 161
+
+
+def test_batch_cuts_on_frame_nearest_pause_midpoint(monkeypatch, tmp_path):
+    stub_communicate(monkeypatch, three_items)
+    outfiles = [tmp_path / f"{i:04d}.mp3" for i in range(3)]
+    ok = asyncio.run(pai_tts.synthesize_batch(["Hello there.", "Second item?", "Third one."], outfiles, "v"))
+
+    assert ok
+    # midpoints 11.25M and 26.75M ticks are frames 46.875 and 111.46 of 24 ms
+    # (240k ticks) each, so the cuts round to frames 47 and 111
+    sizes = [f.stat().st_size for f in outfiles]
+    assert sizes == [47 * 144, (111 - 47) * 144, (161 - 111) * 144]
+    assert all(f.read_bytes()[:4] == FRAME[:4] for f in outfiles)
+
+
+def test_batch_rejects_unmatched_word(monkeypatch, tmp_path):
+    stub_communicate(monkeypatch, lambda text: ([(2 * M, M, "nowhere")], FRAME * 20))
+    outfiles = [tmp_path / "a.mp3", tmp_path / "b.mp3"]
+    assert not asyncio.run(pai_tts.synthesize_batch(["one", "two"], outfiles, "v"))
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_batch_rejects_item_without_words(monkeypatch, tmp_path):
+    stub_communicate(monkeypatch, lambda text: ([(2 * M, M, "one")], FRAME * 20))
+    outfiles = [tmp_path / "a.mp3", tmp_path / "b.mp3"]
+    assert not asyncio.run(pai_tts.synthesize_batch(["one", "two"], outfiles, "v"))
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_batch_rejects_cut_off_frame_boundary(monkeypatch, tmp_path):
+    # 100-byte "frames" break the 144-byte assumption, so cuts miss the sync byte
+    odd_frame = b"\xff" + bytes(99)
+    words = [(2 * M, M, "one"), (10 * M, M, "two")]
+    stub_communicate(monkeypatch, lambda text: (words, odd_frame * 60))
+    outfiles = [tmp_path / "a.mp3", tmp_path / "b.mp3"]
+    assert not asyncio.run(pai_tts.synthesize_batch(["one", "two"], outfiles, "v"))
+
+
+def test_batch_refuses_oversized_request(monkeypatch, tmp_path):
+    texts = stub_communicate(monkeypatch, three_items)
+    big = "&" * (pai_tts.MAX_BATCH_BYTES // 5 + 1)  # escapes to 5 bytes each
+    outfiles = [tmp_path / "a.mp3", tmp_path / "b.mp3"]
+    assert not asyncio.run(pai_tts.synthesize_batch([big, "x"], outfiles, "v"))
+    assert texts == []
+
+
+def test_pool_falls_back_to_one_request_per_item(monkeypatch, tmp_path):
+    def script(text):
+        if "\n" in text:
+            return [(2 * M, M, "nowhere")], FRAME * 20
+        return [(2 * M, M, text)], FRAME * 10
+
+    texts = stub_communicate(monkeypatch, script)
+    outfiles = [tmp_path / "a.mp3", tmp_path / "b.mp3"]
+    pool = pai_tts.EdgeTtsPool("v", 1, warmup=False)
+    asyncio.run(pool.synthesize_batch(["one", "two"], outfiles))
+
+    assert texts == ["one\ntwo", "one", "two"]
+    assert [f.read_bytes() for f in outfiles] == [FRAME * 10, FRAME * 10]
+
+
+def test_build_audio_groups_by_escaped_bytes(monkeypatch, tmp_path):
+    texts = stub_communicate(monkeypatch, lambda text: ([], FRAME))
+    # "a&b" escapes to 7 bytes: 7 + 1 + 7 fits in 15, a third item does not
+    ctx = pai_tts.TTSContext(pai_tts.EdgeTtsPool("v", 1, warmup=False), batch_bytes=15)
+    asyncio.run(pai_tts.build_audio(["a&b", "a&b", "a&b"], tmp_path, ctx))
+
+    assert texts[0] == "a&b\na&b"
+    assert texts[1:] == ["a&b"] * 3  # batch has no words, so it falls back per item
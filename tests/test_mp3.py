@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+
+import pai_tts
+
+# MPEG-1 Layer III, 128 kbit/s, 44.1 kHz: 417-byte frames
+MPEG1_FRAME = bytes([0xFF, 0xFB, 0x90, 0x64]) + bytes(413)
+# MPEG-2 Layer III, 48 kbit/s, 24 kHz (edge-tts output): 144-byte frames of 24 ms
+MPEG2_FRAME = bytes([0xFF, 0xF3, 0x64, 0xC4]) + bytes(140)
+
+
+def id3v2(body_size, footer=False):
+    """ID3v2.4 header with a syncsafe size, followed by *body_size* zero bytes."""
+    size = bytes((body_size >> shift) & 0x7F for shift in (21, 14, 7, 0))
+    flags = 0x10 if footer else 0x00
+    return b"ID3\x04\x00" + bytes([flags]) + size + bytes(body_size) + (bytes(10) if footer else b"")
+
+
+def test_untagged_file(tmp_path):
+    path = tmp_path / "plain.mp3"
+    path.write_bytes(MPEG2_FRAME * 50)
+    assert pai_tts.mp3_duration(path) == pytest.approx(50 * 0.024)
+
+
+def test_tagged_file_skips_id3_tag(tmp_path):
+    path = tmp_path / "tagged.mp3"
+    # 200-byte body exercises the 7-bit syncsafe encoding (0x01 0x48)
+    path.write_bytes(id3v2(200) + MPEG1_FRAME * 100)
+    assert pai_tts.mp3_duration(path) == pytest.approx(100 * 417 * 8 / 128_000)
+
+
+def test_tagged_file_with_footer(tmp_path):
+    path = tmp_path / "footer.mp3"
+    path.write_bytes(id3v2(30, footer=True) + MPEG2_FRAME * 10)
+    assert pai_tts.mp3_duration(path) == pytest.approx(10 * 0.024)
+
+
+def test_non_layer_iii_file(tmp_path):
+    path = tmp_path / "layer2.mp3"
+    path.write_bytes(bytes([0xFF, 0xFD, 0x90, 0x64]) + bytes(400))  # MPEG-1 Layer II
+    assert pai_tts.mp3_duration(path) is None
+
+
+def test_truncated_file(tmp_path):
+    header_only = tmp_path / "header.mp3"
+    header_only.write_bytes(MPEG2_FRAME[:2])
+    tag_only = tmp_path / "tag.mp3"
+    tag_only.write_bytes(id3v2(20))
+    assert pai_tts.mp3_duration(header_only) is None
+    assert pai_tts.mp3_duration(tag_only) is None
+
+
+def test_missing_file(tmp_path):
+    assert pai_tts.mp3_duration(tmp_path / "absent.mp3") is None
+
+
+def test_audio_durations_from_sizes_with_header_fallback(tmp_path, monkeypatch):
+    (tmp_path / "0000.mp3").write_bytes(MPEG2_FRAME * 50)
+    (tmp_path / "0001.mp3").write_bytes(id3v2(200) + MPEG1_FRAME * 100)
+    parsed = []
+    real = pai_tts.mp3_duration
+    monkeypatch.setattr(pai_tts, "mp3_duration", lambda path: parsed.append(path.name) or real(path))
+
+    durations = pai_tts.audio_durations(tmp_path, 3)
+
+    assert durations == [pytest.approx(1.2), pytest.approx(100 * 417 * 8 / 128_000), None]
+    assert parsed == ["0001.mp3"]  # only the file that isn't whole edge-tts frames
+
+
+def test_cached_rebuild_opens_no_mp3s(tmp_path, monkeypatch):
+    class StubCommunicate:
+        def __init__(self, text, voice=None, **kwargs):
+            pass
+
+        async def stream(self):
+            yield {"type": "audio", "data": MPEG2_FRAME * 25}
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "questionnaires").mkdir()
+    (tmp_path / "questionnaires" / "demo.txt").write_text("One?\nTwo.\n", encoding="utf-8")
+    monkeypatch.setattr(pai_tts.edge_tts, "Communicate", StubCommunicate)
+
+    def build():
+        ctx = pai_tts.TTSContext(pai_tts.EdgeTtsPool("v", 2, warmup=False))
+        asyncio.run(pai_tts.build_all_questionnaires(tmp_path / "site", ctx))
+
+    build()
+
+    opened = []
+    real_open = open
+
+    def spy_open(file, *args, **kwargs):
+        opened.append(str(file))
+        return real_open(file, *args, **kwargs)
+
+    monkeypatch.setattr(pai_tts, "open", spy_open, raising=False)
+    monkeypatch.setattr(pai_tts.edge_tts, "Communicate", None)  # any synthesis would fail
+    build()
+
+    assert not [name for name in opened if ".mp3" in name]
+    index = (tmp_path / "site" / "demo" / "index.html").read_text(encoding="utf-8")
+    assert '"duration":0.6' in index  # 25 frames of 24 ms